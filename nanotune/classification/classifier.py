@@ -20,6 +20,14 @@ from sklearn.neighbors import KNeighborsClassifier
 from sklearn.neural_network import MLPClassifier
 from sklearn.preprocessing import StandardScaler
 from sklearn.tree import DecisionTreeClassifier
+from sklearn.utils.validation import check_is_fitted
+
+try:
+    import onnxruntime
+    from skl2onnx import to_onnx
+    onnx_available = True
+except ImportError:
+    onnx_available = False
 
 import nanotune as nt
 from nanotune.data.dataset import Dataset
@@ -98,6 +106,8 @@ class Classifier:
         clf: instance of a scikit-learn binary classifier.
         original_data: all data loaded.
         labels: labels of original data.
+        is_compiled: whether predictions are made using a compiled ONNX
+            model of `clf`, see `compile`.
     """
     def __init__(
         self,
@@ -187,6 +197,9 @@ class Classifier:
             self.clf = KNeighborsClassifier(**self.hyper_parameters)
         else:
             self.clf = None
+        self._onnx_session: Optional[Any] = None
+        self._onnx_binding: Any = None
+        self._onnx_input: Optional[npt.NDArray[np.float32]] = None
 
         (self.original_data, self.labels) = self.load_data(
             self.file_paths, self.data_types, file_fractions=self.file_fractions
@@ -328,6 +341,69 @@ class Classifier:
 
         X_train, _ = self.prep_data(train_data=data_to_use)
         self.clf.fit(X_train, labels_to_use)
+        self._reset_compiled_model()
+
+    @property
+    def is_compiled(self) -> bool:
+        """Whether predictions are made using a compiled ONNX model."""
+        return self._onnx_session is not None
+
+    def compile(self) -> None:
+        """Converts the trained scikit-learn classifier to an ONNX model and
+        makes subsequent calls to `predict` run it using ONNX Runtime, which
+        avoids the per-call overhead of scikit-learn when a classifier is
+        called repeatedly during tuning. The model input is single precision,
+        predictions of samples very close to the decision boundary may
+        therefore differ from those of `clf`. Compiled models are discarded
+        when the classifier is re-trained.
+        Requires skl2onnx and onnxruntime to be installed.
+        """
+        if not onnx_available:
+            raise ImportError(
+                "Compiling classifiers requires skl2onnx and onnxruntime."
+            )
+        check_is_fitted(self.clf)
+        n_features = self.clf.n_features_in_
+        onnx_model = to_onnx(
+            self.clf,
+            np.zeros((1, n_features), dtype=np.float32),
+            options={id(self.clf): {"zipmap": False}},
+        )
+        self._onnx_session = onnxruntime.InferenceSession(
+            onnx_model.SerializeToString(),
+            providers=["CPUExecutionProvider"],
+        )
+        self._onnx_binding = None
+        self._onnx_input = None
+
+    def _reset_compiled_model(self) -> None:
+        self._onnx_session = None
+        self._onnx_binding = None
+        self._onnx_input = None
+
+    def _predict(
+        self,
+        data: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.int64]:
+        """Predicts labels of prepped data, using the compiled model if
+        available. The input buffer of the compiled model is bound once and
+        re-used as long as the number of samples does not change.
+        """
+        if self._onnx_session is None:
+            return self.clf.predict(data)
+
+        if self._onnx_input is None or self._onnx_input.shape != data.shape:
+            session = self._onnx_session
+            self._onnx_input = np.empty(data.shape, dtype=np.float32)
+            self._onnx_binding = session.io_binding()
+            self._onnx_binding.bind_cpu_input(
+                session.get_inputs()[0].name, self._onnx_input
+            )
+            self._onnx_binding.bind_output(session.get_outputs()[0].name)
+
+        np.copyto(self._onnx_input, data, casting="same_kind")
+        self._onnx_session.run_with_iobinding(self._onnx_binding)
+        return self._onnx_binding.copy_outputs_to_cpu()[0]
 
     def prep_data(
         self,
@@ -596,7 +672,7 @@ class Classifier:
 
             _, relevant_data = self.prep_data(test_data=relevant_data)  # type: ignore
 
-            predictions.append(self.clf.predict(relevant_data))
+            predictions.append(self._predict(relevant_data))
 
         return predictions
 
@@ -694,6 +770,7 @@ class Classifier:
             )
 
             probas = self.clf.fit(X_train, train_labels).predict_proba(X_test)
+            self._reset_compiled_model()
 
             train_times.append(time.time() - start_time_train)
 
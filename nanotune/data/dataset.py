@@ -1,4 +1,5 @@
 import copy
+import functools
 import json
 import logging
 from typing import Any, Dict, List, Optional, Tuple
@@ -6,8 +7,7 @@ import numpy.typing as npt
 import numpy as np
 import qcodes as qc
 from qcodes.dataset.data_set import DataSet
-import scipy.fftpack as fp
-import scipy.signal as sg
+from scipy import fft as sfft
 import xarray as xr
 from scipy.ndimage import gaussian_filter
 
@@ -23,8 +23,27 @@ old_readout_methods = {
     'dc_sensor': 'sensing',
 }
 default_readout_methods = nt.config["core"]["readout_methods"]
+# Maximum number of datasets kept by `Dataset.get`.
+dataset_cache_size = 64
 logger = logging.getLogger(__name__)
 
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+try:
+    import numba
+    numba_available = True
+except ImportError:
+    numba_available = False
+
+try:
+    import orjson
+    orjson_available = True
+except ImportError:
+    orjson_available = False
+
 
 class Dataset:
     """Emulates the QCoDeS dataset and adds data post-processing
@@ -57,10 +76,10 @@ class Dataset:
             been renamed to "standard" readout methods defined in `Readout`.
         power_spectrum: xarray dataset containing Fourier frequencies whose
             keys have been renamed to "standard" readout methods defined in
-            `Readout`.
+            `Readout`. Computed on first access.
         filtered_data: xarray dataset containing data to which a Gaussian
             filter has been applied. Keys have been renamed to "standard"
-            readout methods defined in `Readout`.
+            readout methods defined in `Readout`. Computed on first access.
     """
 
     def __init__(
@@ -93,15 +112,78 @@ class Dataset:
         self.ml_label: List[str]
         self.dimensions: Dict[str, int] = {}
         self.readout_methods: Dict[str, str] = {}
+        self._1d_methods: List[str] = []
+        self._2d_methods: List[str] = []
 
         self.raw_data: xr.Dataset = xr.Dataset()
         self.data: xr.Dataset = xr.Dataset()
-        self.power_spectrum: xr.Dataset = xr.Dataset()
-        self.filtered_data: xr.Dataset = xr.Dataset()
+        self._power_spectrum: Optional[xr.Dataset] = None
+        self._filtered_data: Optional[xr.Dataset] = None
 
         self.from_qcodes_dataset()
-        self.prepare_filtered_data()
-        self.compute_power_spectrum()
+
+    @classmethod
+    def get(
+        cls,
+        qc_run_id: int,
+        db_name: Optional[str] = None,
+        db_folder: Optional[str] = None,
+        normalization_tolerances: Tuple[float, float] = (-0.1, 1.1),
+    ) -> "Dataset":
+        """Returns a cached instance, loading the dataset only if it has not
+        been loaded recently. Instances are cached per class, run ID,
+        database and normalization tolerances. Up to `dataset_cache_size`
+        instances are kept.
+
+        Cached instances are shared between callers and must not be
+        modified. They reflect the QCoDeS dataset at the time it was first
+        loaded; call `Dataset.clear_cache` if its data or metadata, e.g.
+        features, have changed since. Instantiate `Dataset` directly if
+        a private, modifiable instance is required.
+
+        Args:
+            qc_run_id: captured run ID of the QCoDeS dataset.
+            db_name: database name. If not specified, the current default
+                database is used.
+            db_folder: folder containing the database. If not specified,
+                `nt.config["db_folder"]` is used.
+            normalization_tolerances: range within which the normalized
+                signal is accepted without a warning.
+
+        Returns:
+            Dataset: instance of `cls`, possibly shared with other callers.
+        """
+        if db_name is None:
+            db_name, db_folder = nt.get_database()
+        else:
+            if db_folder is None:
+                db_folder = nt.config["db_folder"]
+            # Like __init__, make the database current, also on cache hits.
+            nt.set_database(db_name, db_folder=db_folder)
+        return cls._get_cached(
+            qc_run_id, db_name, db_folder, tuple(normalization_tolerances),
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=dataset_cache_size)
+    def _get_cached(
+        cls,
+        qc_run_id: int,
+        db_name: str,
+        db_folder: str,
+        normalization_tolerances: Tuple[float, float],
+    ) -> "Dataset":
+        return cls(
+            qc_run_id,
+            db_name,
+            db_folder=db_folder,
+            normalization_tolerances=normalization_tolerances,
+        )
+
+    @staticmethod
+    def clear_cache() -> None:
+        """Removes all instances cached by `Dataset.get`."""
+        Dataset._get_cached.cache_clear()
 
     @property
     def snapshot(self) -> Dict[str, Any]:
@@ -118,6 +200,32 @@ class Dataset:
         """"""
         return self._normalization_constants
 
+    @property
+    def power_spectrum(self) -> xr.Dataset:
+        """Fourier frequencies of all readout methods. Computed by
+        `compute_power_spectrum` on first access."""
+        if self._power_spectrum is None:
+            self.compute_power_spectrum()
+        assert self._power_spectrum is not None
+        return self._power_spectrum
+
+    @power_spectrum.setter
+    def power_spectrum(self, new_power_spectrum: xr.Dataset) -> None:
+        self._power_spectrum = new_power_spectrum
+
+    @property
+    def filtered_data(self) -> xr.Dataset:
+        """Gaussian filtered data of all readout methods. Computed by
+        `prepare_filtered_data` on first access."""
+        if self._filtered_data is None:
+            self.prepare_filtered_data()
+        assert self._filtered_data is not None
+        return self._filtered_data
+
+    @filtered_data.setter
+    def filtered_data(self, new_filtered_data: xr.Dataset) -> None:
+        self._filtered_data = new_filtered_data
+
     @property
     def features(self) -> Dict[str, Dict[str, Any]]:
         """"""
@@ -166,13 +274,14 @@ class Dataset:
         }
         self._snapshot = {}
         self._nt_metadata = {}
+        get_metadata = qc_dataset.get_metadata
 
         try:
-            self._snapshot = json.loads(qc_dataset.get_metadata("snapshot"))
+            self._snapshot = json_loads(get_metadata("snapshot"))
         except (RuntimeError, TypeError):
             pass
         try:
-            self._nt_metadata = json.loads(qc_dataset.get_metadata(nt.meta_tag))
+            self._nt_metadata = json_loads(get_metadata(nt.meta_tag))
         except (RuntimeError, TypeError):
             pass
 
@@ -208,7 +317,7 @@ class Dataset:
             read_params = [str(it) for it in list(self.raw_data.data_vars)]
             self.readout_methods = dict(zip(methods, read_params))
 
-        quality = qc_dataset.get_metadata("good")
+        quality = get_metadata("good")
         if quality is not None:
             self.quality = int(quality)
         else:
@@ -217,7 +326,7 @@ class Dataset:
         self.ml_label = []
         for label in LABELS:
             if label != "good":
-                lbl = qc_dataset.get_metadata(label)
+                lbl = get_metadata(label)
                 if lbl is None:
                     lbl = 0
                 if int(lbl) == 1:
@@ -232,22 +341,30 @@ class Dataset:
         if rename:
             self._rename_xarray_variables()
 
+        data = self.data
+        raw_data = self.raw_data
+        dimensions = self.dimensions
+        voltage_names = default_coord_names["voltage"]
+        normalize_data = self._normalize_data
+        nt_label = self._nt_label
+
         for r_meth, r_param in self.readout_methods.items():
-            self.dimensions[r_meth] = len(self.raw_data[r_param].dims)
-            nrm_dt = self._normalize_data(self.raw_data[r_param].values, r_meth)
-            self.data[r_meth].values = nrm_dt
+            raw_param = raw_data[r_param]
+            dimensions[r_meth] = len(raw_param.dims)
+            data_meth = data[r_meth]
+            data_meth.values = normalize_data(raw_param.values, r_meth)
 
-            for vi, vr in enumerate(self.raw_data[r_param].depends_on):
-                coord_name = default_coord_names["voltage"][vi]
-                lbl = self._nt_label(r_param, vr)
-                self.data[r_meth][coord_name].attrs["label"] = lbl
+            for vi, vr in enumerate(raw_param.depends_on):
+                lbl = nt_label(r_param, vr)
+                data_meth[voltage_names[vi]].attrs["label"] = lbl
 
-        self.data = self.data.sortby(list(self.data.coords), ascending=True)
+        self._1d_methods = [m for m, d in dimensions.items() if d == 1]
+        self._2d_methods = [m for m, d in dimensions.items() if d == 2]
+        self.data = data.sortby(list(data.coords), ascending=True)
 
     def _nt_label(self, readout_paramter, var) -> str:
-        lbl = self.raw_data[readout_paramter][var].attrs["label"]
-        unit = self.raw_data[readout_paramter][var].attrs["unit"]
-        return f"{lbl} [{unit}]"
+        attrs = self.raw_data[readout_paramter][var].attrs
+        return f"{attrs['label']} [{attrs['unit']}]"
 
     def _rename_xarray_variables(self):
         """Renames xarray dataset keys."""
@@ -263,13 +380,30 @@ class Dataset:
         signal: npt.NDArray[np.float64],
         signal_type,
     ) -> npt.NDArray[np.float64]:
-        """Applies normalization constants."""
-        minv = self.normalization_constants[signal_type][0]
-        maxv = self.normalization_constants[signal_type][1]
+        """Applies normalization constants.
+        If numba is installed, normalization and the search for the extrema
+        of the normalized signal, ignoring NaNs, are fused in a single
+        parallel loop. Otherwise the signal is normalized in one pass, using
+        numexpr if installed or a single in-place division.
+        """
+        minv = float(self.normalization_constants[signal_type][0])
+        maxv = float(self.normalization_constants[signal_type][1])
+
+        if numba_available:
+            normalized_sig, sig_min, sig_max = normalize_fused(
+                np.ascontiguousarray(signal), minv, maxv
+            )
+        else:
+            if ne is not None:
+                normalized_sig = ne.evaluate("(signal - minv) / (maxv - minv)")
+            else:
+                normalized_sig = np.subtract(signal, minv, dtype=np.float64)
+                normalized_sig /= maxv - minv
+            sig_min = np.nanmin(normalized_sig)
+            sig_max = np.nanmax(normalized_sig)
 
-        normalized_sig = (signal - minv) / (maxv - minv)
         min_tol, max_tol = self._normalization_tolerances
-        if np.max(normalized_sig) > max_tol or np.min(normalized_sig) < min_tol:
+        if sig_max > max_tol or sig_min < min_tol:
             msg = (
                 "Dataset {}: ".format(self.qc_run_id),
                 "Wrong normalization constant",
@@ -279,13 +413,14 @@ class Dataset:
 
     def prepare_filtered_data(self):
         """Applies a Gaussian filter and saves the result under the
-        'filtered_data' attribute."""
-        self.filtered_data = self.data.copy(deep=True)
+        'filtered_data' attribute. Coordinates are shared with 'data', only
+        the filtered readout arrays are newly allocated."""
+        filtered_data = self.data.copy(deep=False)
         for read_meth in self.readout_methods:
-            smooth = gaussian_filter(
-                self.filtered_data[read_meth].values, sigma=2
-            )
-            self.filtered_data[read_meth].values = smooth
+            data_meth = self.data[read_meth]
+            smooth = gaussian_filter(data_meth.values, sigma=2)
+            filtered_data[read_meth] = data_meth.copy(deep=False, data=smooth)
+        self.filtered_data = filtered_data
 
     def compute_1D_power_spectrum(
         self,
@@ -293,18 +428,31 @@ class Dataset:
     ) -> xr.DataArray:
         """Computes Fourier frequencies of a 1D measurement.
         Data is detrended before the Fourier transformation is applied.
+        As the signal is real, only the one-sided spectrum of non-negative
+        frequencies is computed.
+        The detrended signal is zero-padded to the next length for which the
+        FFT is fast. Padding only appends zeros beyond the end of the scan,
+        the voltage spacing between samples is unchanged.
+        The transform is computed in single precision and the returned
+        spectrum is of type float32.
+        Padded spectra are not used as classifier input, see
+        `two_sided_power_spectrum`.
         """
-        c_name = default_coord_names["voltage"][0]
-        voltage_x = self.data[readout_method][c_name].values
+        data_meth = self.data[readout_method]
+        voltage_x = data_meth[default_coord_names["voltage"][0]].values
 
         xv = np.unique(voltage_x)
-        signal = self.data[readout_method].values.copy()
-        signal = sg.detrend(signal, axis=0)
+        # detrend_linear returns a new array, data is not modified.
+        signal = detrend_linear(data_meth.values, axis=0)
+        signal = np.ascontiguousarray(signal, dtype=np.float32)
+        n_x = sfft.next_fast_len(signal.shape[0], real=True)
 
-        frequencies_res = fp.fft(signal)
-        frequencies_res = np.abs(fp.fftshift(frequencies_res)) ** 2
+        frequencies_res = sfft.rfft(
+            signal, n=n_x, overwrite_x=True, workers=-1
+        )
+        frequencies_res = np.abs(frequencies_res) ** 2
 
-        fx = fp.fftshift(fp.fftfreq(frequencies_res.shape[0], d=xv[1] - xv[0]))
+        fx = frequency_axis(n_x, xv[1] - xv[0])
 
         freq_xar = xr.DataArray(
             frequencies_res,
@@ -318,25 +466,39 @@ class Dataset:
     ) -> xr.DataArray:
         """Computes Fourier frequencies of a 2D measurement.
         Data is detrended before the Fourier transformation is applied.
+        As the signal is real, the spectrum along the second axis
+        (`frequency_y`) is one-sided, i.e. contains non-negative frequencies
+        only.
+        The detrended signal is zero-padded along both axes to the next
+        lengths for which the FFT is fast. Padding only appends zeros beyond
+        the end of the scan, the voltage spacing between samples is unchanged.
+        The transform is computed in single precision and the returned
+        spectrum is of type float32.
+        Padded spectra are not used as classifier input, see
+        `two_sided_power_spectrum`.
         """
-        c_name_x = default_coord_names["voltage"][0]
-        c_name_y = default_coord_names["voltage"][1]
-        voltage_x = self.data[readout_method][c_name_x].values
-        voltage_y = self.data[readout_method][c_name_y].values
-        signal = self.data[readout_method].values.copy()
+        c_name_x, c_name_y = default_coord_names["voltage"]
+        data_meth = self.data[readout_method]
+        voltage_x = data_meth[c_name_x].values
+        voltage_y = data_meth[c_name_y].values
 
         xv = np.unique(voltage_x)
         yv = np.unique(voltage_y)
-        signal = signal.copy()
 
-        signal = sg.detrend(signal, axis=0)
-        signal = sg.detrend(signal, axis=1)
+        # detrend_linear returns a new array, data is not modified.
+        signal = detrend_linear(data_meth.values, axis=0)
+        signal = detrend_linear(signal, axis=1)
+        signal = np.ascontiguousarray(signal, dtype=np.float32)
+        n_x = sfft.next_fast_len(signal.shape[0], real=True)
+        n_y = sfft.next_fast_len(signal.shape[1], real=True)
 
-        frequencies_res = fp.fft2(signal)
-        frequencies_res = np.abs(fp.fftshift(frequencies_res)) ** 2
+        frequencies_res = sfft.rfft2(
+            signal, s=(n_x, n_y), overwrite_x=True, workers=-1
+        )
+        frequencies_res = np.abs(sfft.fftshift(frequencies_res, axes=0)) ** 2
 
-        fx_1d = fp.fftshift(fp.fftfreq(frequencies_res.shape[0], d=xv[1] - xv[0]))
-        fy_1d = fp.fftshift(fp.fftfreq(frequencies_res.shape[1], d=yv[1] - yv[0]))
+        fx_1d = frequency_axis(n_x, xv[1] - xv[0], one_sided=False)
+        fy_1d = frequency_axis(n_y, yv[1] - yv[0])
 
         freq_xar = xr.DataArray(
             frequencies_res,
@@ -356,14 +518,153 @@ class Dataset:
         filter applied as we do not want to accidentally remove
         information contained in low frequencies.
         """
-        self.power_spectrum = xr.Dataset()
+        n_methods = len(self._1d_methods) + len(self._2d_methods)
+        if n_methods != len(self.readout_methods):
+            raise NotImplementedError
+
+        power_spectrum = xr.Dataset()
+        for methods, compute_spectrum in [
+            (self._1d_methods, self.compute_1D_power_spectrum),
+            (self._2d_methods, self.compute_2D_power_spectrum),
+        ]:
+            for readout_method in methods:
+                freq_xar = compute_spectrum(readout_method)
+                power_spectrum[readout_method] = freq_xar
+
+        self.power_spectrum = power_spectrum
+
+    def reset_power_spectrum(self) -> None:
+        """Discards the power spectrum, e.g. after 'data' has been modified.
+        It is recomputed from the current data on next access."""
+        self._power_spectrum = None
+
+
+if numba_available:
+    @numba.njit(parallel=True, cache=True)  # type: ignore
+    def normalize_fused(
+        signal: npt.NDArray[np.float64],
+        minv: float,
+        maxv: float,
+    ) -> Tuple[npt.NDArray[np.float64], float, float]:
+        """Normalizes `signal` and determines the minimum and maximum of the
+        normalized signal in a single parallel loop. NaNs are propagated to
+        the normalized signal but ignored when looking for extrema.
+
+        Args:
+            signal: C-contiguous data to normalize.
+            minv: value mapped onto 0.
+            maxv: value mapped onto 1.
+
+        Returns:
+            np.ndarray: normalized signal, of the same shape as `signal`.
+            float: minimum of the normalized signal.
+            float: maximum of the normalized signal.
+        """
+        flat_signal = signal.ravel()
+        normalized = np.empty(flat_signal.size, dtype=np.float64)
+        scale = 1.0 / (maxv - minv)
+        sig_min = np.inf
+        sig_max = -np.inf
+        for i in numba.prange(flat_signal.size):
+            value = (flat_signal[i] - minv) * scale
+            normalized[i] = value
+            sig_min = min(sig_min, value)
+            sig_max = max(sig_max, value)
+        return normalized.reshape(signal.shape), sig_min, sig_max
+
+
+def json_loads(serialized: Any) -> Any:
+    """Deserializes a JSON document, using orjson if installed. orjson is
+    stricter than the json module and rejects documents it writes, such as
+    those containing NaN. These, and any other input orjson rejects, are
+    parsed using `json.loads`, whose errors are raised unchanged.
+
+    Args:
+        serialized: JSON document.
+
+    Returns:
+        Any: deserialized document.
+    """
+    if orjson_available:
+        try:
+            return orjson.loads(serialized)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(serialized)
 
-        for readout_method in self.readout_methods.keys():
-            if self.dimensions[readout_method] == 1:
-                freq_xar = self.compute_1D_power_spectrum(readout_method)
-            elif self.dimensions[readout_method] == 2:
-                freq_xar = self.compute_2D_power_spectrum(readout_method)
-            else:
-                raise NotImplementedError
 
-            self.power_spectrum[readout_method] = freq_xar
+def detrend_linear(
+    signal: npt.NDArray[np.float64],
+    axis: int,
+) -> npt.NDArray[np.float64]:
+    """Removes a linear trend along `axis`, assuming uniformly spaced
+    samples. Equivalent to `scipy.signal.detrend(signal, axis=axis)` but
+    using the closed-form least squares solution instead of a call to LAPACK
+    per slice.
+
+    Args:
+        signal: data to detrend.
+        axis: axis along which the linear trend is removed.
+
+    Returns:
+        np.ndarray: detrended data of the same shape as `signal`.
+    """
+    n_points = signal.shape[axis]
+    mean = signal.mean(axis=axis, keepdims=True)
+    if n_points < 2:
+        return signal - mean
+    shape = [1] * signal.ndim
+    shape[axis] = n_points
+    x = (np.arange(n_points) - (n_points - 1) / 2).reshape(shape)
+    slope = (x * signal).sum(axis=axis, keepdims=True) / (x * x).sum()
+    return signal - mean - slope * x
+
+
+def two_sided_power_spectrum(
+    signal: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """Returns the two-sided power spectrum of 1D or 2D data, computed
+    without padding and with the zero frequency shifted to the center along
+    all axes. Data is detrended along each axis first.
+    This is the layout of the 'frequencies' data type exported by
+    `nanotune.data.export_data.prep_data`, which nanotune's classifiers and
+    the training data shipped with nanotune use. It differs from the one-sided
+    and zero-padded spectra stored in `Dataset.power_spectrum`.
+
+    Args:
+        signal: 1D or 2D data.
+
+    Returns:
+        np.ndarray: power spectrum of the same shape as `signal`.
+    """
+    for axis in range(signal.ndim):
+        signal = detrend_linear(signal, axis=axis)
+    spectrum = sfft.fftn(signal, workers=-1)
+    return np.abs(sfft.fftshift(spectrum)) ** 2
+
+
+@functools.lru_cache(maxsize=1024)
+def frequency_axis(
+    n_points: int,
+    spacing: float,
+    one_sided: bool = True,
+) -> npt.NDArray[np.float64]:
+    """Returns the sample frequencies of an FFT of length `n_points`. Axes
+    are computed once per set of arguments and returned read-only, as they
+    are shared between all power spectra of the same shape and resolution.
+
+    Args:
+        n_points: length of the transformed axis, including padding.
+        spacing: voltage difference between samples.
+        one_sided: whether to return the non-negative frequencies of a real
+            FFT, or all frequencies shifted to be centered around zero.
+
+    Returns:
+        np.ndarray: frequency axis.
+    """
+    if one_sided:
+        freqs = sfft.rfftfreq(n_points, d=spacing)
+    else:
+        freqs = sfft.fftshift(sfft.fftfreq(n_points, d=spacing))
+    freqs.flags.writeable = False
+    return freqs
@@ -8,6 +8,7 @@ from scipy.ndimage import generic_gradient_magnitude, sobel
 from skimage.transform import resize
 
 import nanotune as nt
+from nanotune.data.dataset import two_sided_power_spectrum
 
 logger = logging.getLogger(__name__)
 N_2D = nt.config["core"]["standard_shapes"]["2"]
@@ -84,8 +85,6 @@ def prep_data(
             second Fourier frequencies, third gradient and fourth features.
     """
     assert category in nt.config["core"]["features"].keys()
-    if len(dataset.power_spectrum) == 0:
-        dataset.compute_power_spectrum()
 
     condensed_data_all = []
 
@@ -119,7 +118,7 @@ def prep_data(
         # assume we are talking dots and high current was not actually
         # device_max_signal
         dataset.data[readout_method_to_use].values = signal * 0.3
-        dataset.compute_power_spectrum()
+        dataset.reset_power_spectrum()
 
     data_resized = resize(
         signal, shape, anti_aliasing=True, mode="edge"
@@ -129,7 +128,11 @@ def prep_data(
     gradient_resized = resize(
         grad, shape, anti_aliasing=True, mode="constant"
     ).flatten()
-    power = dataset.power_spectrum[readout_method_to_use].values
+    # Classifiers are trained on two-sided, unpadded spectra, which are
+    # not what Dataset.power_spectrum holds.
+    power = two_sided_power_spectrum(
+        dataset.data[readout_method_to_use].values
+    )
     frequencies_resized = resize(
         power, shape, anti_aliasing=True, mode="constant"
     ).flatten()
@@ -2,7 +2,7 @@
 #
 # This software is released under the MIT License.
 # https://opensource.org/licenses/MIT
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, replace
 import logging
 from contextlib import contextmanager
 from typing import Generator, Iterable, List, Optional, Sequence, Tuple, Dict, Union
@@ -342,27 +342,26 @@ class Tuner(qc.Instrument):
                 off.
         """
         measurement_result = MeasurementHistory(device.name)
-        layout_ids = [g.gate_id for g in gates_to_sweep]
-        skip_gates = dict.fromkeys(layout_ids, False)
+        # gates which did not pinch off yet, in the order given
+        remaining_gates = list(gates_to_sweep)
 
         for last_voltage in voltages_to_set:
             gate_to_set.voltage(last_voltage)
 
-            for gate in gates_to_sweep:
-                if not skip_gates[gate.gate_id]:
-                    sub_tuning_result = self.characterize_gate(
-                        device,
-                        gate,
-                        use_safety_voltage_ranges=True,
-                        comment=f"Measuring initial range of {gate.full_name} \
+            for gate in list(remaining_gates):
+                sub_tuning_result = self.characterize_gate(
+                    device,
+                    gate,
+                    use_safety_voltage_ranges=True,
+                    comment=f"Measuring initial range of {gate.full_name} \
                             with {gate_to_set.full_name} at {last_voltage}."
-                    )
-                    measurement_result.add_result(sub_tuning_result)
-                    if sub_tuning_result.success:
-                        skip_gates[gate.gate_id] = True
-                        last_gate_to_pinchoff = gate
+                )
+                measurement_result.add_result(sub_tuning_result)
+                if sub_tuning_result.success:
+                    remaining_gates.remove(gate)
+                    last_gate_to_pinchoff = gate
 
-            if all(skip_gates.values()):
+            if not remaining_gates:
                 break
 
         return measurement_result, last_gate_to_pinchoff, last_voltage
@@ -380,10 +379,10 @@ class Tuner(qc.Instrument):
         Returns:
             DataSettings: new data settings including normalization constants.
         """
-        new_datasettings = DataSettings(**asdict(self.data_settings))
-        norm_csts = device.normalization_constants
-        new_datasettings.normalization_constants = norm_csts
-        return new_datasettings
+        return replace(
+            self.data_settings,
+            normalization_constants=device.normalization_constants,
+        )
 
     def measurement_setpoint_settings(
         self,
@@ -408,13 +407,17 @@ class Tuner(qc.Instrument):
         Returns:
             SetpointSettings: updated setpoint settings.
         """
-        new_settings = SetpointSettings(**asdict(self.setpoint_settings))
-        new_settings.parameters_to_sweep = parameters_to_sweep
-        new_settings.ranges_to_sweep = ranges_to_sweep
-        new_settings.safety_voltage_ranges = safety_voltage_ranges
-        if voltage_precision is not None:
-            new_settings.voltage_precision = voltage_precision
-        return new_settings
+        if voltage_precision is None:
+            voltage_precision = self.setpoint_settings.voltage_precision
+        # Shallow copy: asdict would deep-copy the previously swept QCoDeS
+        # parameters only for them to be replaced.
+        return replace(
+            self.setpoint_settings,
+            parameters_to_sweep=parameters_to_sweep,
+            ranges_to_sweep=ranges_to_sweep,
+            safety_voltage_ranges=safety_voltage_ranges,
+            voltage_precision=voltage_precision,
+        )
 
 
     def get_charge_diagram(
@@ -505,5 +508,9 @@ def linear_voltage_steps(
     Returns:
         Sequence[float]: linearly spaced setpoints.
     """
-    n_steps = int(abs(voltage_range[0] - voltage_range[1]) / voltage_step)
-    return np.linspace(voltage_range[1], voltage_range[0], n_steps).tolist()
+    ratio = abs(voltage_range[0] - voltage_range[1]) / voltage_step
+    # Round first, so that float errors such as 2.7 / 0.3 = 9.000000000000002
+    # do not add a step.
+    n_steps = int(np.ceil(np.round(ratio, 9))) + 1
+    return np.linspace(
+        np.max(voltage_range), np.min(voltage_range), n_steps).tolist()
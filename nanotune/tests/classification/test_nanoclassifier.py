@@ -1,3 +1,51 @@
+import os
+
+import numpy as np
 import pytest
 
 import nanotune as nt
+from nanotune.classification.classifier import Classifier
+
+
+@pytest.fixture(scope="function")
+def pinchoff_data_file(tmp_path):
+    np.random.seed(0)
+    n_samples = 40
+    len_1d = np.prod(nt.config["core"]["standard_shapes"]["1"])
+    n_data_types = len(nt.config["core"]["data_types"])
+    v_x = np.linspace(-1, 0, len_1d)
+
+    data = np.random.normal(0, 0.05, (n_data_types, n_samples, len_1d + 1))
+    labels = np.arange(n_samples) % 2
+    for idx, label in enumerate(labels):
+        if label:
+            data[:, idx, :-1] += 0.5 * (1 + np.tanh(10 * v_x + 5))
+    data[:, :, -1] = labels
+
+    np.save(os.path.join(tmp_path, "pinchoff_test.npy"), data)
+    return tmp_path
+
+
+def test_classifier_compile(pinchoff_data_file):
+    pytest.importorskip("onnxruntime")
+    pytest.importorskip("skl2onnx")
+
+    clf = Classifier(
+        ["pinchoff_test.npy"],
+        "pinchoff",
+        data_types=["signal"],
+        classifier_type="SVC",
+        folder_path=str(pinchoff_data_file),
+    )
+    clf.train()
+    _, test_data = clf.prep_data(test_data=clf.original_data)
+    expected = clf.clf.predict(test_data)
+    assert not clf.is_compiled
+
+    clf.compile()
+    assert clf.is_compiled
+    assert np.array_equal(clf._predict(test_data), expected)
+    assert np.array_equal(clf._predict(test_data[:3]), expected[:3])
+
+    clf.train()
+    assert not clf.is_compiled
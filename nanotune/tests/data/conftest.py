@@ -61,6 +61,26 @@ def nt_dataset_doubledot_partial_metadata(experiment, tmp_path):
         datasaver.dataset.conn.close()
 
 
+@pytest.fixture(scope="function")
+def nt_dataset_doubledot_nan_metadata(experiment, tmp_path):
+    datasaver = save_2Ddata_with_qcodes(generate_doubledot_data, None)
+
+    meta_dict = {
+        "device_name": "dev1",
+        "normalization_constants": {"transport": [0, 1.4]},
+        "features": {"transport": {"amplitude": float("nan")}},
+    }
+    # json.dumps writes NaN, which is not valid JSON.
+    datasaver.dataset.add_metadata(nt.meta_tag, json.dumps(meta_dict))
+    datasaver.dataset.add_metadata(
+        "snapshot", json.dumps({"station": {"offset": float("nan")}})
+    )
+    try:
+        yield datasaver.dataset
+    finally:
+        datasaver.dataset.conn.close()
+
+
 @pytest.fixture(scope="function")
 def experiment_labelled_data(empty_temp_db, tmp_path):
     e = new_experiment("test_experiment", sample_name="test_sample")
@@ -3,6 +3,7 @@ import os
 import numpy as np
 import pytest
 import scipy.fft as fp
+import scipy.signal as sg
 from scipy.ndimage import generic_gradient_magnitude, sobel
 from skimage.transform import resize
 
@@ -132,11 +133,16 @@ def test_prep_data_normalization(nt_dataset_pinchoff, tmp_path):
     ds.data["transport"].values += 0.5
     assert np.max(ds.data["transport"].values) > 1
     assert np.min(ds.data["transport"].values) >= 0.5
+    spectrum_before = ds.power_spectrum["transport"].values
 
     _ = prep_data(ds, "pinchoff")[0]
 
     assert np.max(ds.data["transport"].values) <= 1
     assert np.min(ds.data["transport"].values) <= 0.5
+    # The outdated spectrum is discarded, not recomputed.
+    assert ds._power_spectrum is None
+    spectrum_after = ds.power_spectrum["transport"].values
+    assert not np.allclose(spectrum_after, spectrum_before)
 
 
 def test_prep_data_return_data(nt_dataset_pinchoff, tmp_path):
@@ -146,7 +152,9 @@ def test_prep_data_return_data(nt_dataset_pinchoff, tmp_path):
     shape = tuple(nt.config["core"]["standard_shapes"]["1"])
 
     ds_curr = ds.data["transport"].values
-    ds_freq = ds.power_spectrum["transport"].values
+    # Exported frequencies are two-sided, unpadded and centered, the layout
+    # used by the shipped training data.
+    ds_freq = np.abs(fp.fftshift(fp.fft(sg.detrend(ds_curr, axis=0)))) ** 2
 
     data_resized = resize(ds_curr, shape, anti_aliasing=True, mode="constant").flatten()
     frq = resize(ds_freq, shape, anti_aliasing=True, mode="constant").flatten()
@@ -180,3 +188,17 @@ def test_prep_data_return_data(nt_dataset_pinchoff, tmp_path):
 
     index = nt.config["core"]["data_types"]["features"]
     assert np.allclose(condensed_data[index, 0, :], features)
+
+
+def test_prep_data_2d_frequencies(nt_dataset_doubledot, tmp_path):
+    ds = nt.Dataset(1, db_name="temp.db", db_folder=str(tmp_path))
+    condensed_data = np.array(prep_data(ds, "doubledot")[0])
+    shape = tuple(nt.config["core"]["standard_shapes"]["2"])
+
+    ds_curr = ds.data["transport"].values
+    ds_freq = sg.detrend(sg.detrend(ds_curr, axis=0), axis=1)
+    ds_freq = np.abs(fp.fftshift(fp.fft2(ds_freq))) ** 2
+    frq = resize(ds_freq, shape, anti_aliasing=True, mode="constant").flatten()
+
+    index = nt.config["core"]["data_types"]["frequencies"]
+    assert np.allclose(condensed_data[index, 0, :], frq)
@@ -5,7 +5,7 @@ import pytest
 from qcodes.dataset.experiment_container import load_by_id
 
 import nanotune as nt
-from nanotune.data.dataset import Dataset
+from nanotune.data.dataset import Dataset, json_loads
 
 
 def test_dataset_attributes_after_init(nt_dataset_doubledot, tmp_path):
@@ -62,6 +62,28 @@ def test_dataset_defaults_for_missing_metadata(
     assert ds.ml_label == ["doubledot"]
 
 
+def test_dataset_metadata_with_nan(
+    nt_dataset_doubledot_nan_metadata, tmp_path
+):
+    ds = Dataset(1, db_name="temp.db", db_folder=str(tmp_path))
+
+    assert ds.device_name == "dev1"
+    assert ds.normalization_constants["transport"] == [0, 1.4]
+    assert np.isnan(ds.features["transport"]["amplitude"])
+    assert np.isnan(ds.snapshot["station"]["offset"])
+    raw_max = np.nanmax(ds.raw_data["current"].values)
+    assert np.isclose(np.nanmax(ds.data["transport"].values), raw_max / 1.4)
+
+
+def test_json_loads():
+    assert json_loads('{"a": [1, 2]}') == {"a": [1, 2]}
+    assert np.isnan(json_loads('{"a": NaN}')["a"])
+    with pytest.raises(json.JSONDecodeError):
+        json_loads('{"a": ')
+    with pytest.raises(TypeError):
+        json_loads(None)
+
+
 def test_dataset_property_getters(nt_dataset_pinchoff, tmp_path):
     ds = Dataset(1, db_name="temp.db", db_folder=str(tmp_path))
 
@@ -109,3 +131,32 @@ def test_dataset_property_getters(nt_dataset_pinchoff, tmp_path):
 
     qc_ds = load_by_id(1)
     assert ds.features == nt_metadata["features"]
+
+
+def test_dataset_lazy_post_processing(nt_dataset_doubledot, tmp_path):
+    ds = Dataset(1, db_name="temp.db", db_folder=str(tmp_path))
+
+    assert ds._power_spectrum is None
+    assert ds._filtered_data is None
+
+    assert len(ds.power_spectrum) == len(ds.data)
+    assert len(ds.filtered_data) == len(ds.data)
+    assert ds._power_spectrum is ds.power_spectrum
+    assert ds._filtered_data is ds.filtered_data
+
+
+def test_dataset_get_cached(nt_dataset_doubledot, tmp_path):
+    Dataset.clear_cache()
+    ds = Dataset.get(1, db_name="temp.db", db_folder=str(tmp_path))
+
+    assert ds.qc_run_id == 1
+    assert Dataset.get(1, db_name="temp.db", db_folder=str(tmp_path)) is ds
+    assert Dataset.get(
+        1,
+        db_name="temp.db",
+        db_folder=str(tmp_path),
+        normalization_tolerances=(-0.2, 1.2),
+    ) is not ds
+
+    Dataset.clear_cache()
+    assert Dataset.get(1, db_name="temp.db", db_folder=str(tmp_path)) is not ds
@@ -2,14 +2,15 @@ import pprint
 
 import numpy as np
 import pytest
-import scipy.fftpack as fp
 import scipy.signal as sg
+from scipy import fft as sfft
 from scipy.ndimage import generic_gradient_magnitude, sobel
 from skimage.transform import resize
 
 import nanotune as nt
 from nanotune.data.dataset import (Dataset, default_coord_names,
-                                   default_readout_methods)
+                                   default_readout_methods, detrend_linear,
+                                   frequency_axis, two_sided_power_spectrum)
 from nanotune.math.gaussians import gaussian2D_fct
 from nanotune.tests.data_generator_methods import generate_doubledot_data
 
@@ -90,6 +91,25 @@ def test_dataset_normalisation(nt_dataset_pinchoff, tmp_path):
     assert np.min(norm_sig) >= 0.0
 
 
+def test_dataset_normalisation_nan(nt_dataset_pinchoff, tmp_path, caplog):
+    ds = Dataset(1, db_name="temp.db", db_folder=str(tmp_path))
+
+    v_x = np.linspace(-0.1, 0, 100)
+    sig = 0.6 * (1 + np.tanh(1000 * v_x + 50))
+    sig[3] = np.nan
+
+    norm_sig = ds._normalize_data(sig, "transport")
+    assert norm_sig.shape == sig.shape
+    assert np.allclose(norm_sig, sig / 1.2, equal_nan=True)
+    norm_sig = ds._normalize_data(sig, "sensing")
+    assert np.allclose(norm_sig, (sig + 0.13) / 1.23, equal_nan=True)
+    assert np.isnan(norm_sig[3])
+    assert "Wrong normalization constant" not in caplog.text
+
+    _ = ds._normalize_data(sig * 2, "transport")
+    assert caplog.text.count("Wrong normalization constant") == 1
+
+
 def test_dataset_1d_frequencies(nt_dataset_pinchoff, tmp_path):
     ds = Dataset(1, db_name="temp.db", db_folder=str(tmp_path))
 
@@ -107,22 +127,29 @@ def test_dataset_1d_frequencies(nt_dataset_pinchoff, tmp_path):
     signal = ds_sig.copy()
     signal = sg.detrend(signal, axis=0)
 
-    frequencies_res = fp.fft(signal)
-    frequencies_res = np.abs(fp.fftshift(frequencies_res)) ** 2
+    n_x = sfft.next_fast_len(signal.shape[0], real=True)
+    frequencies_res = sfft.rfft(signal, n=n_x)
+    frequencies_res = np.abs(frequencies_res) ** 2
 
-    fx = fp.fftshift(fp.fftfreq(frequencies_res.shape[0], d=xv[1] - xv[0]))
+    fx = sfft.rfftfreq(n_x, d=xv[1] - xv[0])
     coord_name = default_coord_names["frequency"][0]
     ds_fx = ds.power_spectrum["transport"][coord_name].values
     ds_freq = ds.power_spectrum["transport"].values
 
     assert np.allclose(ds_fx, fx)
-    assert np.allclose(ds_freq, frequencies_res)
+    # Spectra are computed in single precision.
+    assert ds_freq.dtype == np.float32
+    assert np.allclose(
+        ds_freq, frequencies_res, atol=1e-6 * frequencies_res.max()
+    )
 
 
 def test_dataset_2d_frequencies(nt_dataset_doubledot, tmp_path):
     ds = Dataset(1, db_name="temp.db", db_folder=str(tmp_path))
+    data_before = ds.data["transport"].values.copy()
 
     ds.compute_power_spectrum()
+    assert np.array_equal(ds.data["transport"].values, data_before)
     assert len(ds.power_spectrum) == 2
 
     ds_vx = ds.data["transport"][default_coord_names["voltage"][0]].values
@@ -135,11 +162,13 @@ def test_dataset_2d_frequencies(nt_dataset_doubledot, tmp_path):
     ds_curr = sg.detrend(ds_curr, axis=0)
     ds_curr = sg.detrend(ds_curr, axis=1)
 
-    frequencies_res = fp.fft2(ds_curr)
-    frequencies_res = np.abs(fp.fftshift(frequencies_res)) ** 2
+    n_x = sfft.next_fast_len(ds_curr.shape[0], real=True)
+    n_y = sfft.next_fast_len(ds_curr.shape[1], real=True)
+    frequencies_res = sfft.rfft2(ds_curr, s=(n_x, n_y))
+    frequencies_res = np.abs(sfft.fftshift(frequencies_res, axes=0)) ** 2
 
-    fx_1d = fp.fftshift(fp.fftfreq(frequencies_res.shape[0], d=xv[1] - xv[0]))
-    fy_1d = fp.fftshift(fp.fftfreq(frequencies_res.shape[1], d=yv[1] - yv[0]))
+    fx_1d = sfft.fftshift(sfft.fftfreq(n_x, d=xv[1] - xv[0]))
+    fy_1d = sfft.rfftfreq(n_y, d=yv[1] - yv[0])
 
     # fx, fy = np.meshgrid(fx_1d, fy_1d, indexing="ij")
     # frequencies_res = np.abs(frequencies_res)
@@ -151,7 +180,11 @@ def test_dataset_2d_frequencies(nt_dataset_doubledot, tmp_path):
 
     assert np.allclose(ds_fx, fx_1d)
     assert np.allclose(ds_fy, fy_1d)
-    assert np.allclose(ds_freq, frequencies_res)
+    # Spectra are computed in single precision.
+    assert ds_freq.dtype == np.float32
+    assert np.allclose(
+        ds_freq, frequencies_res, atol=1e-6 * frequencies_res.max()
+    )
 
 
 def test_1D_prepare_filtered_data(nt_dataset_pinchoff, tmp_path):
@@ -164,3 +197,48 @@ def test_1D_prepare_filtered_data(nt_dataset_pinchoff, tmp_path):
     assert not np.allclose(
         pf.filtered_data.sensing.values, pf.data.sensing.values, rtol=rtol
     )
+    assert not np.shares_memory(
+        pf.filtered_data.transport.values, pf.data.transport.values
+    )
+
+
+def test_detrend_linear():
+    np.random.seed(0)
+    signal = np.random.normal(0, 1, (31, 20))
+    signal += np.linspace(0, 3, 20)[np.newaxis, :]
+
+    for axis in [0, 1]:
+        assert np.allclose(
+            detrend_linear(signal, axis=axis), sg.detrend(signal, axis=axis)
+        )
+    assert np.allclose(
+        detrend_linear(signal[:, 0], axis=0), sg.detrend(signal[:, 0])
+    )
+
+
+def test_frequency_axis():
+    fx = frequency_axis(16, 0.01)
+    assert np.allclose(fx, sfft.rfftfreq(16, d=0.01))
+    assert frequency_axis(16, 0.01) is fx
+    assert not fx.flags.writeable
+
+    fx = frequency_axis(15, 0.01, one_sided=False)
+    assert np.allclose(fx, sfft.fftshift(sfft.fftfreq(15, d=0.01)))
+
+
+def test_two_sided_power_spectrum():
+    np.random.seed(0)
+    # 97 is padded to 100 points in Dataset.power_spectrum, exported spectra
+    # must not be.
+    signal = np.random.normal(0, 1, 97)
+    expected = np.abs(sfft.fftshift(sfft.fft(sg.detrend(signal)))) ** 2
+    spectrum = two_sided_power_spectrum(signal)
+    assert spectrum.shape == signal.shape
+    assert np.allclose(spectrum, expected)
+
+    signal = np.random.normal(0, 1, (97, 50))
+    expected = sg.detrend(sg.detrend(signal, axis=0), axis=1)
+    expected = np.abs(sfft.fftshift(sfft.fft2(expected))) ** 2
+    spectrum = two_sided_power_spectrum(signal)
+    assert spectrum.shape == signal.shape
+    assert np.allclose(spectrum, expected)
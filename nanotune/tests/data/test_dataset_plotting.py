@@ -2,9 +2,13 @@ import os
 
 import matplotlib.pyplot as plt
 import pytest
+from qcodes import new_experiment
 
 import nanotune as nt
 from nanotune.data.plotting import plot_dataset
+from nanotune.tests.data_generator_methods import (generate_pinchoff_data,
+                                                   generate_pinchoff_metadata)
+from nanotune.tests.data_savers import save_1Ddata_with_qcodes
 
 
 def test_2d_dataset_plotting(nt_dataset_doubledot, tmp_path):
@@ -72,3 +76,24 @@ def test_dataset_plot_saving(nt_dataset_doubledot, tmp_path):
     )
     os.path.exists(os.path.join(str(tmp_path), "testfig.png"))
     os.path.exists(os.path.join(str(tmp_path), "dataset.eps"))
+
+
+def test_dataset_plotting_recreated_database(nt_dataset_doubledot, tmp_path):
+    _ = plot_dataset(1, "temp.db", db_folder=str(tmp_path), save_figures=False)
+
+    # Re-create the database with 1D data under the same name.
+    nt_dataset_doubledot.conn.close()
+    os.remove(os.path.join(str(tmp_path), "temp.db"))
+    nt.new_database("temp.db", str(tmp_path))
+    new_experiment("test-experiment", sample_name="test_sample")
+    datasaver = save_1Ddata_with_qcodes(
+        generate_pinchoff_data, generate_pinchoff_metadata
+    )
+
+    nt.new_database("other.db", str(tmp_path))
+    ax, _ = plot_dataset(
+        1, "temp.db", db_folder=str(tmp_path), save_figures=False,
+    )
+    assert nt.get_database()[0] == "temp.db"
+    assert ax[0][0].get_title() == datasaver.dataset.guid
+    assert len(ax[0][0].get_lines()) == 1
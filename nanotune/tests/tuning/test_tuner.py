@@ -1,6 +1,7 @@
 import copy
 from nanotune.tests.mock_classifier import MockClassifer
 
+import numpy as np
 import pytest
 import matplotlib.pyplot as plt
 from dataclasses import asdict
@@ -32,6 +33,24 @@ def test_set_back_voltages(gate_1, gate_2):
     assert gate_2.voltage() == -0.9
 
 
+def test_linear_voltage_steps():
+    v_steps = linear_voltage_steps([-2, 0], 0.2)
+    assert len(v_steps) == 11
+    assert v_steps[0] == 0
+    assert v_steps[-1] == -2
+    assert v_steps[1] - v_steps[0] == pytest.approx(-0.2)
+
+    v_steps = linear_voltage_steps([0, -1], 0.3)
+    assert len(v_steps) == 5
+    assert v_steps[0] == 0
+    assert v_steps[-1] == -1
+
+    for v_min in [-2.7, -4.2, -2.1]:
+        v_steps = linear_voltage_steps([v_min, 0], 0.3)
+        assert len(v_steps) == round(abs(v_min) / 0.3) + 1
+        assert np.allclose(np.diff(v_steps), -0.3)
+
+
 def test_tuner_init_and_attributes(tuner, tmp_path):
     assert tuner.data_settings.db_name == "temp.db"
     assert tuner.data_settings.db_folder == str(tmp_path)
@@ -144,6 +163,16 @@ def test_measurement_setpoint_settings(
     assert new_settings.parameters_to_sweep == [sim_device.left_barrier]
     assert new_settings.ranges_to_sweep == [[-2, 0]]
     assert new_settings.safety_voltage_ranges == [[-3, 0]]
+    assert new_settings.voltage_precision == prev_settings.voltage_precision
+    assert tuner.setpoint_settings == prev_settings
+
+    new_settings = tuner.measurement_setpoint_settings(
+        [sim_device.left_barrier],
+        [[-2, 0]],
+        [[-3, 0]],
+        voltage_precision=0.005)
+    assert new_settings.voltage_precision == 0.005
+    assert tuner.setpoint_settings.voltage_precision != 0.005
 
 
 def test_get_pairwise_pinchoff(
@@ -165,7 +194,7 @@ def test_get_pairwise_pinchoff(
         gates_to_sweep,
         v_steps,
     )
-    assert last_voltage == -0.44444444444444464
+    assert last_voltage == pytest.approx(-0.4)
     assert len(measurement_result.to_dict()) == 9
     assert last_gate_to_pinchoff.full_name == gates_to_sweep[0].full_name
 
@@ -2,7 +2,6 @@
 #
 # This software is released under the MIT License.
 # https://opensource.org/licenses/MIT
-import copy
 import logging
 from typing import List, Sequence, Tuple
 
@@ -131,13 +130,14 @@ def finish_early_pinched_off(
     """
 
     finish = False
-    new_recent_output = copy.deepcopy(recent_measurement_strengths)
-    new_recent_output.append(last_measurement_strength)
     n_setpoints_to_track = int(voltage_interval_to_track / (voltage_precision))
     n_setpoints_to_track += 1
+    # Slicing copies the list, recent_measurement_strengths is not modified.
+    new_recent_output = recent_measurement_strengths[-n_setpoints_to_track:]
+    new_recent_output.append(last_measurement_strength)
     if len(new_recent_output) > n_setpoints_to_track:
-        new_recent_output = new_recent_output[-n_setpoints_to_track:]
-        avg_output = np.mean(new_recent_output)
+        del new_recent_output[0]
+        avg_output = sum(new_recent_output) / n_setpoints_to_track
 
         n_cts = normalization_constant
         norm_avg = (avg_output - n_cts[0]) / (n_cts[1] - n_cts[0])